@@ -1,45 +1,53 @@
 # app/client.py
-import asyncio
+import os
 from typing import Optional, Dict, List, Any
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase, Query
 from application_sdk.clients import ClientInterface
 from application_sdk.observability.logger_adaptor import get_logger
 
 logger = get_logger(__name__)
 
+# Sized for the parallel activity fan-out in the workflow; with the
+# driver shared process-wide the pool is the concurrency ceiling, so
+# make it tunable without a code change
+_DEFAULT_POOL_SIZE = int(os.environ.get("NEO4J_POOL_SIZE", "50"))
+
+# How long a session waits for a free pooled connection before failing;
+# bounded so a saturated pool surfaces as an error instead of a hang
+_ACQUISITION_TIMEOUT = float(os.environ.get("NEO4J_ACQUISITION_TIMEOUT", "60"))
+
 class Neo4jClient(ClientInterface):
-    def __init__(self, uri: str, username: str, password: str):
+    def __init__(self, uri: str, username: str, password: str,
+                 pool_size: Optional[int] = None):
         self.uri = uri
         self.username = username
         self.password = password
+        self.pool_size = pool_size or _DEFAULT_POOL_SIZE
         self.driver = None
 
     async def load(self):
-        """Initialize the Neo4j driver and verify connectivity."""
+        """Initialize the async Neo4j driver and verify connectivity."""
         try:
             logger.info(f"Connecting to Neo4j at {self.uri}")
-            
-            def _create_driver():
-                driver = GraphDatabase.driver(
-                    self.uri, 
-                    auth=(self.username, self.password),
-                    # Add connection timeout and other configs
-                    connection_timeout=30,
-                    max_connection_lifetime=3600
-                )
-                return driver
-            
-            # Run the synchronous driver creation in a thread pool
-            self.driver = await asyncio.get_event_loop().run_in_executor(None, _create_driver)
-            
+
+            self.driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.username, self.password),
+                # Add connection timeout and other configs
+                connection_timeout=30,
+                max_connection_lifetime=3600,
+                max_connection_pool_size=self.pool_size,
+                connection_acquisition_timeout=_ACQUISITION_TIMEOUT
+            )
+
             # Verify connectivity after creating driver
             await self.verify_connectivity()
             logger.info("Neo4j driver loaded successfully")
-            
+
         except Exception as e:
             logger.error(f"Failed to load Neo4j driver: {str(e)}")
             if self.driver:
-                self.driver.close()
+                await self.driver.close()
                 self.driver = None
             raise
 
@@ -47,10 +55,7 @@ class Neo4jClient(ClientInterface):
         """Close the Neo4j driver connection."""
         if self.driver:
             try:
-                def _close_driver():
-                    self.driver.close()
-                
-                await asyncio.get_event_loop().run_in_executor(None, _close_driver)
+                await self.driver.close()
                 logger.info("Neo4j driver closed successfully")
             except Exception as e:
                 logger.error(f"Error closing Neo4j driver: {str(e)}")
@@ -61,36 +66,91 @@ class Neo4jClient(ClientInterface):
         """Verify that we can connect to the Neo4j database."""
         if not self.driver:
             raise RuntimeError("Driver not initialized. Call load() first.")
-        
+
         try:
-            def _verify():
-                self.driver.verify_connectivity()
-                return True
-            
-            # Run the synchronous verify_connectivity in a thread pool
-            await asyncio.get_event_loop().run_in_executor(None, _verify)
+            await self.driver.verify_connectivity()
             logger.info("Neo4j connectivity verified successfully")
-            
+
         except Exception as e:
             logger.error(f"Neo4j connectivity verification failed: {str(e)}")
             raise
 
-    async def run_query(self, query: str, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
-        """Execute a Cypher query and return results as a list of dictionaries."""
+    async def run_query(self, query: str, params: Optional[Dict] = None,
+                        keys: Optional[List[str]] = None,
+                        fetch_size: int = 1000,
+                        timeout: Optional[float] = None) -> List[Any]:
+        """Execute a Cypher query and return results as a list of dictionaries.
+
+        When keys is given, only those columns are returned as plain value
+        lists via Result.values(), skipping the per-record dict construction.
+        fetch_size tunes Bolt record batching: -1 pulls everything in one
+        batch (best for small results), larger values cut PULL round trips
+        on big streams. timeout (seconds) caps server-side execution so a
+        runaway query can't hold a pooled connection indefinitely.
+        """
         if not self.driver:
             await self.load()
-        
+
         try:
-            def _run_query():
-                with self.driver.session() as session:
-                    result = session.run(query, params or {})
-                    return [record.data() for record in result]
-            
-            # Run the synchronous Neo4j operations in a thread pool
-            results = await asyncio.get_event_loop().run_in_executor(None, _run_query)
+            async with self.driver.session(fetch_size=fetch_size) as session:
+                if timeout is not None:
+                    query = Query(query, timeout=timeout)
+                result = await session.run(query, params or {})
+                if keys is not None:
+                    results = await result.values(*keys)
+                else:
+                    results = [record.data() async for record in result]
             logger.debug(f"Query executed successfully, returned {len(results)} records")
             return results
-            
+
         except Exception as e:
             logger.error(f"Failed to execute query: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    async def run_query_stream(self, query: str, params: Optional[Dict] = None,
+                               fetch_size: int = 1000,
+                               timeout: Optional[float] = None):
+        """Execute a Cypher query and yield records as they arrive.
+
+        Unlike run_query this never materializes the full result list,
+        so Python-side processing starts before the last record lands
+        and peak memory stays at one Bolt batch.
+        """
+        if not self.driver:
+            await self.load()
+
+        try:
+            async with self.driver.session(fetch_size=fetch_size) as session:
+                if timeout is not None:
+                    query = Query(query, timeout=timeout)
+                result = await session.run(query, params or {})
+                async for record in result:
+                    yield record
+
+        except Exception as e:
+            logger.error(f"Failed to execute query: {str(e)}")
+            raise
+
+    async def run_query_column(self, query: str, params: Optional[Dict] = None,
+                               fetch_size: int = 1000,
+                               timeout: Optional[float] = None) -> List[Any]:
+        """Execute a Cypher query and return its first column as a flat list.
+
+        For single-column projections this skips record dict/row
+        construction entirely — each record contributes one value.
+        """
+        if not self.driver:
+            await self.load()
+
+        try:
+            async with self.driver.session(fetch_size=fetch_size) as session:
+                if timeout is not None:
+                    query = Query(query, timeout=timeout)
+                result = await session.run(query, params or {})
+                values = [record[0] async for record in result]
+            logger.debug(f"Query executed successfully, returned {len(values)} values")
+            return values
+
+        except Exception as e:
+            logger.error(f"Failed to execute query: {str(e)}")
+            raise
@@ -1,7 +1,10 @@
 # app/handler.py
 
+import asyncio
 import os
-from typing import List, Dict, Any
+import time
+from operator import itemgetter
+from typing import Final, List, Dict, Any
 from datetime import date, datetime
 from application_sdk.handlers import HandlerInterface
 from application_sdk.observability.decorators.observability_decorator import observability
@@ -14,90 +17,311 @@ logger = get_logger(__name__)
 metrics = get_metrics()
 traces = get_traces()
 
+# Map Cypher type names from db.schema.nodeTypeProperties to the names
+# the sampling-based inference has always reported
+_CYPHER_TYPE_NAMES = {
+    "Boolean": "BOOLEAN",
+    "Long": "INTEGER",
+    "Double": "FLOAT",
+    "Date": "DATE",
+    "DateTime": "DATETIME",
+    "String": "STRING",
+}
+
+# Exact-type dispatch for Python-side inference; type(value) lookups
+# mean bool never collides with int the way chained isinstance would
+_TYPE_MAP = {
+    bool: "BOOLEAN",
+    int: "INTEGER",
+    float: "FLOAT",
+    date: "DATE",
+    datetime: "DATETIME",
+}
+
+# Hot catalog queries as module constants: Neo4j's plan cache is keyed
+# on the exact query string, so presenting the same object every call
+# guarantees cache hits. Each collect()s its column server-side so the
+# driver materializes one record holding one list instead of N records.
+_Q_LABELS: Final[str] = (
+    "CALL db.labels() YIELD label "
+    "WITH label ORDER BY label RETURN collect(label) AS labels"
+)
+_Q_RELS: Final[str] = (
+    "CALL db.relationshipTypes() YIELD relationshipType "
+    "WITH relationshipType ORDER BY relationshipType "
+    "RETURN collect(relationshipType) AS relationship_types"
+)
+
+_Q_PROPERTY_KEYS: Final[str] = (
+    "CALL db.propertyKeys() YIELD propertyKey "
+    "WITH propertyKey ORDER BY propertyKey "
+    "RETURN collect(propertyKey) AS property_keys"
+)
+_Q_METADATA_BATCH: Final[str] = (
+    "CALL { CALL db.labels() YIELD label RETURN collect(label) AS labels } "
+    "CALL { CALL db.relationshipTypes() YIELD relationshipType "
+    "RETURN collect(relationshipType) AS relationship_types } "
+    "CALL { CALL db.propertyKeys() YIELD propertyKey "
+    "RETURN collect(propertyKey) AS property_keys } "
+    "RETURN labels, relationship_types, property_keys"
+)
+_Q_CONSTRAINTS: Final[str] = "SHOW CONSTRAINTS YIELD name, type, labelsOrTypes, properties"
+_Q_INDEXES: Final[str] = "SHOW INDEXES YIELD name, type, labelsOrTypes, properties"
+_Q_NODE_TYPE_PROPERTIES: Final[str] = (
+    "CALL db.schema.nodeTypeProperties() "
+    "YIELD nodeLabels, propertyName, propertyTypes "
+    "RETURN nodeLabels, propertyName, propertyTypes"
+)
+_Q_SCHEMA_VISUALIZATION: Final[str] = (
+    "CALL db.schema.visualization() YIELD relationships RETURN relationships"
+)
+_Q_META_STATS: Final[str] = (
+    "CALL apoc.meta.stats() YIELD nodeCount, relCount, labels, relTypesCount "
+    "RETURN nodeCount, relCount, labels, relTypesCount"
+)
+
+
+def _build_quality_query(distinct: str) -> str:
+    """Render the fused quality query with the given distinct-count expression."""
+    return f"""
+    CALL {{
+        MATCH (c:Customer)
+        RETURN count(c) AS c_total,
+               count(c.email) AS c_non_null,
+               {distinct.format('c.email')} AS c_unique
+    }}
+    CALL {{
+        MATCH (p:Product)
+        RETURN count(p) AS p_total,
+               count(p.category) AS p_non_null,
+               {distinct.format('p.category')} AS p_unique
+    }}
+    CALL {{
+        MATCH (o:Order)
+        RETURN count(o) AS o_total,
+               count(o.status) AS o_non_null,
+               {distinct.format('o.status')} AS o_unique
+    }}
+    RETURN *
+    """
+
+
+# The distinct-count expression is a structural choice (APOC estimator
+# vs exact count), not a value, so it can't be a $param; render both
+# variants once at import so each run presents an identical string to
+# the server's plan cache
+_Q_QUALITY_APOC: Final[str] = _build_quality_query("apoc.agg.cardinality({})")
+_Q_QUALITY_PLAIN: Final[str] = _build_quality_query("count(DISTINCT {})")
+
+# Span creation and metric emission cost more than the sub-millisecond
+# getters they would instrument, so full observability on those is
+# opt-in; the heavyweight entrypoints stay instrumented unconditionally
+_OBS_VERBOSE = os.environ.get("NEOSENSE_OBS_VERBOSE", "").lower() in ("1", "true")
+
+# Server-side cap for every metadata query so a runaway statement can't
+# starve the driver's connection pool
+_QUERY_TIMEOUT: Final[float] = float(os.environ.get("NEO4J_QUERY_TIMEOUT", "30"))
+
+
+def _observability_if_verbose(func):
+    if _OBS_VERBOSE:
+        return observability(logger=logger, metrics=metrics, traces=traces)(func)
+    return func
+
 class Neo4jHandler(HandlerInterface):
     def __init__(self, client: Neo4jClient):
         self.client = client
+        # TTL cache for slow-changing catalog data: key -> (expiry, value)
+        self._cache: Dict[str, tuple] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
 
-    @observability(logger=logger, metrics=metrics, traces=traces)
-    async def test_auth(self, **kwargs) -> bool: 
+    async def _cached(self, key: str, ttl: float, fn) -> Any:
+        """Return a cached value for key if fresh, else recompute via fn.
+
+        Entries are keyed on the client URI as well, so a handler pointed
+        at a different database never serves another database's catalog.
+        """
+        cache_key = f"{self.client.uri}:{key}"
+        entry = self._cache.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._cache_hits += 1
+            return entry[1]
+        self._cache_misses += 1
+        value = await fn()
+        self._cache[cache_key] = (time.monotonic() + ttl, value)
+        logger.debug(f"Cache miss for {key} (hits={self._cache_hits}, misses={self._cache_misses})")
+        return value
+
+    @_observability_if_verbose
+    async def test_auth(self, **kwargs) -> bool:
         await self.client.verify_connectivity()
         return True
     
     @observability(logger=logger, metrics=metrics, traces=traces)
-    async def fetch_metadata(self, **kwargs) -> Dict[str, Any]: 
-        return {}
+    async def fetch_metadata(self, **kwargs) -> Dict[str, Any]:
+        try:
+            # Labels, relationship types and property keys in one round
+            # trip: each CALL subquery collects its catalog into a column
+            record = (await self.client.run_query(_Q_METADATA_BATCH, fetch_size=-1, timeout=_QUERY_TIMEOUT))[0]
+            labels = record['labels']
+            relationship_types = record['relationship_types']
+            property_keys = record['property_keys']
+        except Exception as e:
+            # Servers without CALL {} subqueries: overlap the three
+            # individual catalog reads instead of awaiting them in turn
+            logger.warning(f"Batched metadata query unavailable, falling back to concurrent reads: {e}")
+            labels, relationship_types, property_keys = await asyncio.gather(
+                self.get_node_labels(),
+                self.get_relationship_types(),
+                self.get_property_keys(),
+            )
+
+        return {
+            "node_labels": labels,
+            "relationship_types": relationship_types,
+            "property_keys": property_keys,
+        }
     
     @observability(logger=logger, metrics=metrics, traces=traces)
-    async def load(self, **kwargs): 
+    async def load(self, **kwargs):
+        # Reconnecting may point at a fresh database state; drop any
+        # cached catalog results so the next reads reflect it
+        self._cache.clear()
         await self.client.load()
     
-    @observability(logger=logger, metrics=metrics, traces=traces)
-    async def preflight_check(self, **kwargs) -> bool: 
-        await self.client.verify_connectivity()
-        return True
+    @_observability_if_verbose
+    async def preflight_check(self, strict: bool = False, **kwargs) -> bool:
+        # verify_connectivity already performs the Bolt handshake, so
+        # the extra RETURN 1 round trip is opt-in; cache briefly so
+        # retry bursts don't re-verify on every attempt
+        async def _verify() -> bool:
+            await self.client.verify_connectivity()
+            if strict:
+                await self.client.run_query("RETURN 1 as test", timeout=_QUERY_TIMEOUT)
+            return True
+        return await self._cached(f"preflight_check:{strict}", 10, _verify)
 
-    @observability(logger=logger, metrics=metrics, traces=traces)
+    @_observability_if_verbose
     async def get_node_labels(self) -> List[str]:
-        query = "CALL db.labels() YIELD label RETURN label ORDER BY label"
-        results = await self.client.run_query(query)
-        return [record['label'] for record in results]
+        async def _fetch() -> List[str]:
+            rows = await self.client.run_query_column(_Q_LABELS, fetch_size=-1, timeout=_QUERY_TIMEOUT)
+            return rows[0]
+        return await self._cached("node_labels", 60, _fetch)
 
-    @observability(logger=logger, metrics=metrics, traces=traces)
+    @_observability_if_verbose
     async def get_relationship_types(self) -> List[str]:
-        query = "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType ORDER BY relationshipType"
-        results = await self.client.run_query(query)
-        return [record['relationshipType'] for record in results]
+        async def _fetch() -> List[str]:
+            rows = await self.client.run_query_column(_Q_RELS, fetch_size=-1, timeout=_QUERY_TIMEOUT)
+            return rows[0]
+        return await self._cached("relationship_types", 60, _fetch)
+
+    @_observability_if_verbose
+    async def get_property_keys(self) -> List[str]:
+        async def _fetch() -> List[str]:
+            rows = await self.client.run_query_column(_Q_PROPERTY_KEYS, fetch_size=-1, timeout=_QUERY_TIMEOUT)
+            return rows[0]
+        return await self._cached("property_keys", 60, _fetch)
 
     @observability(logger=logger, metrics=metrics, traces=traces)
     async def get_schema_info(self) -> Dict[str, Any]:
         logger.info("Fetching comprehensive schema information.")
-        
-        # Get constraints
-        constraints_query = "SHOW CONSTRAINTS YIELD name, type, labelsOrTypes, properties"
-        constraints = await self.client.run_query(constraints_query)
-        
-        # Get node property types
+
+        # Constraints, property types and lineage are independent, so
+        # run them concurrently
+        constraints, node_property_types, lineage = await asyncio.gather(
+            self.client.run_query(_Q_CONSTRAINTS, timeout=_QUERY_TIMEOUT),
+            self._get_node_property_types(),
+            self._get_lineage_info(),
+        )
+
+        return {
+            "constraints": constraints,
+            "node_property_types": node_property_types,
+            "lineage": lineage
+        }
+
+    async def _get_node_property_types(self) -> Dict[str, Any]:
+        """Get property types per node label from the server-side schema catalog."""
+        try:
+            # db.schema.nodeTypeProperties computes types from the store,
+            # avoiding shipping sample nodes over Bolt entirely; stream
+            # the records so wide catalogs never double-materialize
+            node_property_types = {}
+            async for record in self.client.run_query_stream(_Q_NODE_TYPE_PROPERTIES, timeout=_QUERY_TIMEOUT):
+                prop = record['propertyName']
+                if prop is None:
+                    continue
+                types = record['propertyTypes'] or []
+                prop_type = _CYPHER_TYPE_NAMES.get(types[0], "STRING") if types else "STRING"
+                for label in record['nodeLabels']:
+                    node_property_types.setdefault(label, {})[prop] = prop_type
+
+            return node_property_types
+
+        except Exception as e:
+            logger.warning(f"db.schema.nodeTypeProperties unavailable, falling back to sampling: {e}")
+            return await self._get_node_property_types_sampled()
+
+    async def _get_node_property_types_sampled(self) -> Dict[str, Any]:
+        """Infer property types for every node label from sampled nodes."""
         node_property_types = {}
         labels = await self.get_node_labels()
-        
-        for label in labels:
-            # Get sample of nodes to determine property types
-            sample_query = f"MATCH (n:`{label}`) RETURN n LIMIT 10"
-            sample_results = await self.client.run_query(sample_query)
-            
-            if sample_results:
+
+        # Fetch samples for every label in one round trip instead of one
+        # query per label
+        sample_query = """
+        UNWIND $labels AS lbl
+        CALL {
+            WITH lbl
+            MATCH (n) WHERE lbl IN labels(n)
+            RETURN n LIMIT 10
+        }
+        RETURN lbl, collect(n) AS samples
+        """
+        sample_results = await self.client.run_query(sample_query, params={"labels": labels}, timeout=_QUERY_TIMEOUT) if labels else []
+
+        for record in sample_results:
+            label = record['lbl']
+            samples = record['samples']
+
+            if samples:
                 properties = {}
                 # Analyze all samples to get comprehensive property info
-                for result in sample_results:
-                    node_data = result['n']
+                for node_data in samples:
                     for key, value in node_data.items():
                         if key not in properties:
-                            if isinstance(value, bool):
-                                properties[key] = "BOOLEAN"
-                            elif isinstance(value, int):
-                                properties[key] = "INTEGER" 
-                            elif isinstance(value, float):
-                                properties[key] = "FLOAT"
-                            elif isinstance(value, date):
-                                properties[key] = "DATE"
-                            elif isinstance(value, datetime):
-                                properties[key] = "DATETIME"
-                            else:
-                                properties[key] = "STRING"
-                
+                            properties[key] = _TYPE_MAP.get(type(value), "STRING")
+
                 node_property_types[label] = properties
-        
-        # Get lineage information - simplified and more reliable approach
-        lineage = await self._get_lineage_info()
-        
-        return {
-            "constraints": constraints,
-            "node_property_types": node_property_types,
-            "lineage": lineage
-        }
+
+        return node_property_types
 
     async def _get_lineage_info(self) -> List[str]:
         """Extract lineage/dependency information from the graph"""
+        try:
+            # db.schema.visualization returns the distinct schema topology
+            # straight from the catalog instead of scanning every edge
+            results = await self.client.run_query(_Q_SCHEMA_VISUALIZATION, timeout=_QUERY_TIMEOUT)
+
+            lineage_patterns = []
+            for record in results:
+                for rel in record['relationships']:
+                    # Each relationship arrives as (start_node, type, end_node)
+                    # where the virtual schema nodes carry the label as 'name'
+                    start_props, rel_type, end_props = rel
+                    pattern = f"(:{start_props.get('name')})-[:{rel_type}]->(:{end_props.get('name')})"
+                    lineage_patterns.append(pattern)
+
+            lineage_patterns.sort()
+            return lineage_patterns
+
+        except Exception as e:
+            logger.warning(f"db.schema.visualization unavailable, falling back to edge scan: {e}")
+            return await self._get_lineage_info_scan()
+
+    async def _get_lineage_info_scan(self) -> List[str]:
+        """Extract lineage patterns by scanning relationships (no catalog needed)."""
         try:
             # Get relationship patterns
             pattern_query = """
@@ -107,22 +331,33 @@ class Neo4jHandler(HandlerInterface):
             ORDER BY source_label, rel_type, target_label
             """
             
-            patterns_result = await self.client.run_query(pattern_query)
-            lineage_patterns = []
-            
-            for record in patterns_result:
-                source = record['source_label']
-                rel = record['rel_type'] 
-                target = record['target_label']
-                pattern = f"(:{source})-[:{rel}]->(:{target})"
-                lineage_patterns.append(pattern)
-            
-            return lineage_patterns
+            patterns_result = await self.client.run_query(pattern_query, timeout=_QUERY_TIMEOUT)
+
+            # itemgetter extracts all three columns in one C-level call
+            # per record instead of three dict lookups in bytecode
+            extract = itemgetter('source_label', 'rel_type', 'target_label')
+            return [
+                f"(:{source})-[:{rel}]->(:{target})"
+                for source, rel, target in map(extract, patterns_result)
+            ]
             
         except Exception as e:
             logger.warning(f"Failed to extract lineage info: {e}")
             return []
 
+    async def _supports_apoc_cardinality(self) -> bool:
+        """Detect once whether apoc.agg.cardinality is installed."""
+        async def _detect() -> bool:
+            try:
+                results = await self.client.run_query(
+                    "SHOW FUNCTIONS YIELD name WHERE name = 'apoc.agg.cardinality' RETURN name"
+                )
+                return bool(results)
+            except Exception as e:
+                logger.debug(f"apoc.agg.cardinality detection failed: {e}")
+                return False
+        return await self._cached("apoc_cardinality", 3600, _detect)
+
     @observability(logger=logger, metrics=metrics, traces=traces)
     async def get_quality_and_context(self) -> Dict[str, Any]:
         """Get data quality metrics and business context"""
@@ -131,85 +366,74 @@ class Neo4jHandler(HandlerInterface):
         business_context = {}
         
         try:
-            # Customer email quality check
-            customer_email_query = """
-            MATCH (c:Customer) 
-            RETURN count(c) AS total, 
-                   count(c.email) AS non_null,
-                   count(DISTINCT c.email) AS unique_emails
-            """
-            customer_email_res = (await self.client.run_query(customer_email_query))[0]
-            
+            # count(DISTINCT x) builds a full hash set server-side; when
+            # APOC is available use its HyperLogLog estimator instead,
+            # which runs in constant memory on large labels. All three
+            # quality aggregates come back in a single round trip.
+            if await self._supports_apoc_cardinality():
+                quality_query = _Q_QUALITY_APOC
+            else:
+                quality_query = _Q_QUALITY_PLAIN
+            quality_res = (await self.client.run_query(quality_query, timeout=_QUERY_TIMEOUT))[0]
+
             quality_metrics["Customer.email"] = {
                 "metric_type": "Null Count",
-                "total_records": customer_email_res['total'],
-                "null_count": customer_email_res['total'] - customer_email_res['non_null'],
-                "unique_values": customer_email_res.get('unique_emails', 0)
+                "total_records": quality_res['c_total'],
+                "null_count": quality_res['c_total'] - quality_res['c_non_null'],
+                "unique_values": quality_res.get('c_unique', 0)
             }
-            
-            # Product category quality check  
-            product_category_query = """
-            MATCH (p:Product) 
-            RETURN count(p) as total, 
-                   count(p.category) as non_null_categories,
-                   count(DISTINCT p.category) as unique_categories
-            """
-            product_category_res = (await self.client.run_query(product_category_query))[0]
-            
+
             quality_metrics["Product.category"] = {
                 "metric_type": "Uniqueness",
-                "total_records": product_category_res['total'],
-                "null_count": product_category_res['total'] - product_category_res['non_null_categories'],
-                "unique_values": product_category_res['unique_categories']
+                "total_records": quality_res['p_total'],
+                "null_count": quality_res['p_total'] - quality_res['p_non_null'],
+                "unique_values": quality_res['p_unique']
             }
-            
-            # Additional quality metrics for other important fields
-            order_status_query = """
-            MATCH (o:Order)
-            RETURN count(o) as total,
-                   count(o.status) as non_null_status,
-                   count(DISTINCT o.status) as unique_statuses
-            """
-            order_status_res = (await self.client.run_query(order_status_query))[0]
-            
+
             quality_metrics["Order.status"] = {
-                "metric_type": "Completeness", 
-                "total_records": order_status_res['total'],
-                "null_count": order_status_res['total'] - order_status_res['non_null_status'],
-                "unique_values": order_status_res['unique_statuses']
+                "metric_type": "Completeness",
+                "total_records": quality_res['o_total'],
+                "null_count": quality_res['o_total'] - quality_res['o_non_null'],
+                "unique_values": quality_res['o_unique']
             }
-            
+
         except Exception as e:
             logger.error(f"Error calculating quality metrics: {e}")
         
         try:
-            # Business context - get descriptions and meaningful business info
-            product_desc_query = """
-            MATCH (p:Product) 
-            WHERE p.description IS NOT NULL 
-            RETURN p.name AS product_name, 
-                   p.description AS product_description,
-                   p.category AS category,
-                   p.price AS price
-            ORDER BY p.name
-            """
-            product_descriptions = await self.client.run_query(product_desc_query)
-            
-            # Customer segments
-            customer_segments_query = """
-            MATCH (c:Customer)
-            RETURN c.isPremium as is_premium, count(c) as customer_count
-            """
-            customer_segments = await self.client.run_query(customer_segments_query)
-            
-            # Order statistics
-            order_stats_query = """
-            MATCH (o:Order)
-            RETURN o.status as order_status, count(o) as order_count
-            ORDER BY order_count DESC
+            # Business context - product descriptions, customer segments
+            # and order statistics in one round trip via CALL subqueries,
+            # each collected into its own column
+            context_query = """
+            CALL {
+                MATCH (p:Product)
+                WHERE p.description IS NOT NULL
+                WITH p ORDER BY p.name
+                RETURN collect({product_name: p.name,
+                                product_description: p.description,
+                                category: p.category,
+                                price: p.price}) AS descs
+            }
+            CALL {
+                MATCH (c:Customer)
+                WITH c.isPremium AS is_premium, count(c) AS customer_count
+                RETURN collect({is_premium: is_premium,
+                                customer_count: customer_count}) AS segs
+            }
+            CALL {
+                MATCH (o:Order)
+                WITH o.status AS order_status, count(o) AS order_count
+                ORDER BY order_count DESC
+                RETURN collect({order_status: order_status,
+                                order_count: order_count}) AS stats
+            }
+            RETURN descs, segs, stats
             """
-            order_stats = await self.client.run_query(order_stats_query)
-            
+            context_res = (await self.client.run_query(context_query, fetch_size=-1, timeout=_QUERY_TIMEOUT))[0]
+            product_descriptions = context_res['descs']
+            customer_segments = context_res['segs']
+            order_stats = context_res['stats']
+
             business_context = {
                 "product_catalog": {
                     "descriptions": product_descriptions,
@@ -233,35 +457,69 @@ class Neo4jHandler(HandlerInterface):
         """Get graph statistics and index information"""
         
         try:
-            # Get indexes
-            indexes_query = "SHOW INDEXES YIELD name, type, labelsOrTypes, properties"
-            indexes_result = await self.client.run_query(indexes_query)
-            
-            # Get basic graph statistics
-            stats_queries = {
-                "total_nodes": "MATCH (n) RETURN count(n) as count",
-                "total_relationships": "MATCH ()-[r]->() RETURN count(r) as count",
-                "node_counts_by_label": "MATCH (n) RETURN labels(n)[0] as label, count(n) as count ORDER BY count DESC",
-                "relationship_counts_by_type": "MATCH ()-[r]->() RETURN type(r) as type, count(r) as count ORDER BY count DESC"
-            }
-            
-            statistics = {}
-            for stat_name, query in stats_queries.items():
-                try:
-                    result = await self.client.run_query(query)
-                    statistics[stat_name] = result
-                except Exception as e:
-                    logger.warning(f"Failed to get {stat_name}: {e}")
-                    statistics[stat_name] = f"Error: {str(e)}"
-            
+            indexes_result, statistics = await asyncio.gather(
+                self.client.run_query(_Q_INDEXES, timeout=_QUERY_TIMEOUT),
+                self._get_graph_statistics(),
+            )
+
             return {
                 "statistics": statistics,
                 "indexes": indexes_result
             }
-            
+
         except Exception as e:
             logger.error(f"Error getting graph statistics: {e}")
             return {
                 "statistics": {"error": f"Failed to get statistics: {str(e)}"},
                 "indexes": []
-            }
\ No newline at end of file
+            }
+
+    async def _get_graph_statistics(self) -> Dict[str, Any]:
+        """Get node/relationship counts, preferring the cached store stats."""
+        try:
+            # apoc.meta.stats reads counts the store already maintains,
+            # so this is O(1) regardless of graph size
+            stats = (await self.client.run_query(_Q_META_STATS, timeout=_QUERY_TIMEOUT))[0]
+
+            return {
+                "total_nodes": [{"count": stats['nodeCount']}],
+                "total_relationships": [{"count": stats['relCount']}],
+                "node_counts_by_label": [
+                    {"label": label, "count": count}
+                    for label, count in sorted(stats['labels'].items(), key=lambda kv: kv[1], reverse=True)
+                ],
+                "relationship_counts_by_type": [
+                    {"type": rel_type, "count": count}
+                    for rel_type, count in sorted(stats['relTypesCount'].items(), key=lambda kv: kv[1], reverse=True)
+                ],
+            }
+
+        except Exception as e:
+            logger.warning(f"apoc.meta.stats unavailable, falling back to full scans: {e}")
+            return await self._get_graph_statistics_scan()
+
+    async def _get_graph_statistics_scan(self) -> Dict[str, Any]:
+        """Count nodes and relationships with full scans (no APOC needed)."""
+        stats_queries = {
+            "total_nodes": "MATCH (n) RETURN count(n) as count",
+            "total_relationships": "MATCH ()-[r]->() RETURN count(r) as count",
+            "node_counts_by_label": "MATCH (n) RETURN labels(n)[0] as label, count(n) as count ORDER BY count DESC",
+            "relationship_counts_by_type": "MATCH ()-[r]->() RETURN type(r) as type, count(r) as count ORDER BY count DESC"
+        }
+
+        # The statistics queries are independent, so run them all
+        # concurrently
+        results = await asyncio.gather(
+            *[self.client.run_query(query, timeout=_QUERY_TIMEOUT) for query in stats_queries.values()],
+            return_exceptions=True
+        )
+
+        statistics = {}
+        for stat_name, result in zip(stats_queries, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to get {stat_name}: {result}")
+                statistics[stat_name] = f"Error: {str(result)}"
+            else:
+                statistics[stat_name] = result
+
+        return statistics
\ No newline at end of file
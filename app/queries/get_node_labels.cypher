@@ -1,3 +0,0 @@
-CALL db.labels() YIELD label 
-RETURN label 
-ORDER BY label
\ No newline at end of file
@@ -1,3 +0,0 @@
-CALL db.propertyKeys() YIELD propertyKey 
-RETURN propertyKey 
-ORDER BY propertyKey
\ No newline at end of file
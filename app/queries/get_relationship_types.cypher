@@ -1,3 +0,0 @@
-CALL db.relationshipTypes() YIELD relationshipType 
-RETURN relationshipType 
-ORDER BY relationshipType
\ No newline at end of file
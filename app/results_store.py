@@ -0,0 +1,81 @@
+# app/results_store.py
+"""SQLite-backed store for workflow metadata results.
+
+A single WAL-mode database gives the result reads an indexed lookup on
+one open file descriptor, with sqlite's page cache keeping hot rows in
+memory — no per-request open/parse of JSON files. Everything here is
+blocking; call it through asyncio.to_thread from async code.
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from application_sdk.observability.logger_adaptor import get_logger
+
+logger = get_logger(__name__)
+
+_DB_PATH = os.environ.get("NEOSENSE_RESULTS_DB", "workflow_results.db")
+
+_conn: Optional[sqlite3.Connection] = None
+# One shared connection across worker threads; sqlite serializes writes
+# anyway, so a single lock is simpler than a connection pool
+_lock = threading.Lock()
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(id TEXT PRIMARY KEY, body BLOB, ts INT)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_results_ts ON results(ts)")
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def store(workflow_id: str, body: bytes) -> None:
+    """Upsert the serialized result for a workflow."""
+    with _lock:
+        conn = _get_conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (id, body, ts) VALUES (?, ?, ?)",
+                (workflow_id, body, int(time.time())),
+            )
+
+
+def load(workflow_id: str) -> Optional[bytes]:
+    """Return the stored result bytes, or None when absent."""
+    with _lock:
+        row = _get_conn().execute(
+            "SELECT body FROM results WHERE id = ?", (workflow_id,)
+        ).fetchone()
+    return row[0] if row else None
+
+
+def load_latest() -> Optional[bytes]:
+    """Return the most recently stored result bytes, or None when empty."""
+    with _lock:
+        row = _get_conn().execute(
+            "SELECT body FROM results ORDER BY ts DESC, rowid DESC LIMIT 1"
+        ).fetchone()
+    return row[0] if row else None
+
+
+def close() -> None:
+    """Close the shared connection (process shutdown)."""
+    global _conn
+    with _lock:
+        if _conn is not None:
+            try:
+                _conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to close results store: {e}")
+            _conn = None
@@ -1,10 +1,19 @@
 import asyncio
+import gzip
+import hashlib
+import os
+import time
+from collections import OrderedDict
 from pathlib import Path
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, FastAPI, HTTPException, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+from app import results_store
 from app.activities import Neo4jActivities
 from app.workflow import Neo4jWorkflow
 from application_sdk.application import BaseApplication
@@ -19,6 +28,433 @@ logger = get_logger(__name__)
 metrics = get_metrics()
 traces = get_traces()
 
+# Test-connection clients keyed by credentials. A fresh driver pays a
+# TLS + auth handshake on every probe; reusing one rides the driver's
+# own connection pool instead. Entries expire after a minute so revoked
+# credentials don't keep a live pool around, and the cache is bounded
+# so distinct credential sets can't accumulate driver pools.
+_CLIENT_CACHE_TTL = 60.0
+_CLIENT_CACHE_MAX = 8
+# A request can fetch a client just before it's evicted, so closes are
+# deferred past the longest a test query can run (the 30s driver
+# connection timeout plus slack) instead of yanking the driver away
+_CLIENT_CLOSE_GRACE = 60.0
+_client_cache: dict[tuple, tuple[float, Any]] = {}
+_client_cache_lock = asyncio.Lock()
+# Keep references to in-flight deferred closes so they aren't GC'd
+_client_close_tasks: set = set()
+
+
+def _evict_clients_locked() -> list:
+    """Drop expired and overflow cache entries; caller holds the lock.
+
+    Returns the evicted clients — close them outside the lock.
+    """
+    now = time.monotonic()
+    evicted = [
+        _client_cache.pop(key)[1]
+        for key in [k for k, (ts, _c) in _client_cache.items()
+                    if now - ts >= _CLIENT_CACHE_TTL]
+    ]
+    while len(_client_cache) > _CLIENT_CACHE_MAX:
+        oldest = min(_client_cache, key=lambda k: _client_cache[k][0])
+        evicted.append(_client_cache.pop(oldest)[1])
+    return evicted
+
+
+async def _close_client_after_grace(client) -> None:
+    await asyncio.sleep(_CLIENT_CLOSE_GRACE)
+    try:
+        await client.close()
+    except Exception as e:
+        logger.debug("Failed to close evicted Neo4j client: %s", e)
+
+
+def _schedule_client_close(client) -> None:
+    task = asyncio.create_task(_close_client_after_grace(client))
+    _client_close_tasks.add(task)
+    task.add_done_callback(_client_close_tasks.discard)
+
+
+async def _get_test_client(uri: str, username: str, password: str):
+    """Return a loaded Neo4jClient for the credentials, cached briefly."""
+    from app.client import Neo4jClient
+
+    pw_hash = hashlib.blake2b(password.encode(), digest_size=16).hexdigest()
+    key = (uri, username, pw_hash)
+    async with _client_cache_lock:
+        evicted = _evict_clients_locked()
+        hit = _client_cache.get(key)
+    for stale in evicted:
+        _schedule_client_close(stale)
+    if hit is not None:
+        return hit[1]
+
+    client = Neo4jClient(uri=uri, username=username, password=password)
+    await client.load()
+
+    extra = None
+    async with _client_cache_lock:
+        current = _client_cache.get(key)
+        if current is not None:
+            # A concurrent probe cached a client while we were loading;
+            # keep theirs (it may already be serving a query) and drop
+            # ours, which nothing else holds yet
+            extra = client
+            client = current[1]
+        else:
+            _client_cache[key] = (time.monotonic(), client)
+    if extra is not None:
+        await extra.close()
+    return client
+
+
+async def _close_cached_clients():
+    """Close every cached test-connection client (server shutdown)."""
+    async with _client_cache_lock:
+        clients = [client for _, client in _client_cache.values()]
+        _client_cache.clear()
+    for client in clients:
+        try:
+            await client.close()
+        except Exception:
+            pass
+
+
+class _CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache assets.
+
+    The asset filenames aren't content-hashed, so keep the lifetime
+    modest rather than immutable.
+    """
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = "public, max-age=300"
+        return response
+
+
+class _TTLDict:
+    """Size- and TTL-bounded mapping for in-memory workflow results.
+
+    Presents the dict surface the handlers already use; entries expire
+    after ttl seconds and the oldest are evicted past maxsize, so a
+    long-running server holds a constant memory ceiling.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+
+    def _purge(self) -> None:
+        # Constant ttl means insertion order is expiry order
+        now = time.monotonic()
+        while self._data:
+            _, (expiry, _value) = next(iter(self._data.items()))
+            if expiry > now and len(self._data) <= self.maxsize:
+                break
+            self._data.popitem(last=False)
+
+    def __setitem__(self, key: str, value) -> None:
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._purge()
+
+    def __getitem__(self, key: str):
+        expiry, value = self._data[key]
+        if expiry <= time.monotonic():
+            del self._data[key]
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        self._purge()
+        return len(self._data)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def update(self, other: dict) -> None:
+        for key, value in other.items():
+            self[key] = value
+
+
+# Result files are written once per workflow but polled repeatedly;
+# cache the raw bytes keyed on mtime so unchanged files cost one stat
+# instead of a read plus reparse, with small LRU eviction
+_RESULT_CACHE_MAX = 64
+_result_cache: "OrderedDict[str, tuple[int, bytes]]" = OrderedDict()
+
+
+# Where the legacy per-workflow JSON files live; joined once per lookup
+# off a single module-level Path instead of re-splicing string segments
+_RESULTS_DIR = Path("workflow_results")
+
+
+def _probe_result(value, source: str):
+    """Unwrap one gather(return_exceptions=True) slot.
+
+    A failed probe (permissions, locked/corrupt DB, ...) logs and
+    degrades to None so the next fallback still gets its chance.
+    """
+    if isinstance(value, BaseException):
+        logger.warning("Result probe failed (%s): %s", source, value)
+        return None
+    return value
+
+
+async def _load_stored_result(workflow_id=None):
+    """Fetch serialized result bytes for a workflow, or the latest.
+
+    One reader for both GET handlers: sqlite first, then the legacy
+    JSON files, then the newest stored row as a last resort. Returns
+    bytes or None; blocking work runs off the event loop.
+    """
+    latest_file = str(_RESULTS_DIR / "latest.json")
+    if workflow_id is not None:
+        try:
+            data = await asyncio.to_thread(results_store.load, workflow_id)
+        except Exception as e:
+            logger.warning("Result probe failed (results db): %s", e)
+            data = None
+        if data is not None:
+            return data
+        # Probe all three fallbacks concurrently — total latency is the
+        # slowest probe instead of their sum, which matters on slow
+        # disks. Preference order is preserved when picking the winner
+        specific, latest_row, latest_bytes = await asyncio.gather(
+            asyncio.to_thread(_read_result_bytes, str(_RESULTS_DIR / f"{workflow_id}.json")),
+            asyncio.to_thread(results_store.load_latest),
+            asyncio.to_thread(_read_result_bytes, latest_file),
+            return_exceptions=True,
+        )
+        return (_probe_result(specific, "result file")
+                or _probe_result(latest_row, "results db")
+                or _probe_result(latest_bytes, "latest file"))
+    latest_row, latest_bytes = await asyncio.gather(
+        asyncio.to_thread(results_store.load_latest),
+        asyncio.to_thread(_read_result_bytes, latest_file),
+        return_exceptions=True,
+    )
+    return (_probe_result(latest_row, "results db")
+            or _probe_result(latest_bytes, "latest file"))
+
+
+def _read_result_bytes(path: str):
+    """Read a result file, serving cached bytes while mtime is unchanged."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    cached = _result_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        _result_cache.move_to_end(path)
+        return cached[1]
+    with open(path, "rb") as f:
+        data = f.read()
+    _result_cache[path] = (st.st_mtime_ns, data)
+    _result_cache.move_to_end(path)
+    if len(_result_cache) > _RESULT_CACHE_MAX:
+        _result_cache.popitem(last=False)
+    return data
+
+
+# Sample payload served by /test/metadata. It never changes, so load
+# the serialized bytes once at import from the data file next to this
+# module and compute the ETag up front; the handler then just hands
+# the same body back. Keeping it as JSON data rather than a ~200-line
+# dict literal also trims module parse/compile time.
+_TEST_METADATA_BYTES = orjson.dumps(
+    orjson.loads((Path(__file__).parent / "test_metadata.json").read_bytes())
+)
+_TEST_METADATA_ETAG = '"' + hashlib.blake2b(_TEST_METADATA_BYTES, digest_size=16).hexdigest() + '"'
+# Compressed once at import so gzip-capable clients cost zero
+# compression work per request
+_TEST_METADATA_GZ = gzip.compress(_TEST_METADATA_BYTES, 6)
+
+class _AppState:
+    """Shared mutable state behind the module-level route handlers.
+
+    One slotted instance replaces the closure cells the handlers used
+    to capture, so they register as plain module functions.
+    """
+
+    __slots__ = ("workflow_results", "store_queue", "store_drain_task")
+
+    def __init__(self):
+        # Bounded in-memory storage for workflow results (dict surface,
+        # constant memory ceiling)
+        self.workflow_results = _TTLDict(maxsize=1024, ttl=3600)
+        # Stores are buffered through this queue and drained in batches
+        # by one consumer task, started on server startup
+        self.store_queue: asyncio.Queue = asyncio.Queue()
+        self.store_drain_task = None
+
+
+_state = _AppState()
+
+
+async def _drain_store_queue():
+    while True:
+        items = [await _state.store_queue.get()]
+        while not _state.store_queue.empty() and len(items) < 64:
+            items.append(_state.store_queue.get_nowait())
+        _state.workflow_results.update(dict(items))
+
+def _start_store_drain():
+    # Created on startup so the task lands on the server's loop
+    _state.store_drain_task = asyncio.create_task(_drain_store_queue())
+
+# Test connection function
+async def test_connection_handler(request: Request):
+    """Test Neo4j connection with provided credentials"""
+    try:
+        # Parse the body with orjson rather than request.json()'s
+        # stdlib loads
+        try:
+            body = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
+            return {"success": False, "error": "Invalid JSON body"}
+
+        # Extract credentials
+        uri = body.get("neo4j_uri")
+        username = body.get("neo4j_username")
+        password = body.get("neo4j_password")
+
+        logger.debug("Testing connection to %s with username %s", uri, username)
+
+        if not all([uri, username, password]):
+            return {"success": False, "error": "Missing required credentials"}
+
+        # Test connection on a cached client — repeat probes with the
+        # same credentials reuse the driver's pool instead of paying
+        # a fresh handshake
+        client = await _get_test_client(uri, username, password)
+
+        # Run a simple test query
+        result = await client.run_query("RETURN 1 as test")
+
+        logger.debug("Connection test successful")
+        return {"success": True, "message": "Connection successful"}
+
+    except Exception as e:
+        logger.error("Connection test failed: %s", e)
+        return {"success": False, "error": str(e)}
+
+# Workflow result handlers
+async def get_workflow_result_handler(workflow_id: str):
+    """Get workflow result from file storage or memory"""
+    logger.debug("Checking for workflow result: %s", workflow_id)
+
+    # First check in-memory storage — one lookup, no file I/O or
+    # thread hop on a hit. "latest" is never a memory key, so route
+    # it straight to the shared reader's latest branch
+    if workflow_id != "latest":
+        hit = _state.workflow_results.get(workflow_id)
+        if hit is not None:
+            logger.debug("Found workflow result in memory")
+            return hit
+        data = await _load_stored_result(workflow_id)
+    else:
+        data = await _load_stored_result()
+    if data is not None:
+        logger.debug("Found stored workflow result")
+        return Response(content=data, media_type="application/json")
+
+    logger.debug("Workflow result not ready yet")
+    raise HTTPException(status_code=404, detail="Workflow not ready")
+
+async def get_latest_workflow_result_handler():
+    """Get the latest workflow result"""
+    logger.debug("Fetching latest workflow result")
+
+    data = await _load_stored_result()
+    if data is not None:
+        logger.debug("Found latest workflow result")
+        return Response(content=data, media_type="application/json")
+
+    logger.debug("No latest workflow result available")
+    raise HTTPException(status_code=404, detail="No workflow results available")
+
+# Ceiling on stored result bodies; matches the 16MB Dapr body limit
+# configured in the poe tasks
+_MAX_RESULT_BODY = 16 * 1024 * 1024
+
+async def store_workflow_result_handler(workflow_id: str, request: Request):
+    """Store workflow result (this will be called by our workflow)"""
+    logger.debug("Storing result for workflow: %s", workflow_id)
+    # Stream the body instead of buffering it blind so an oversized
+    # payload is rejected as soon as it crosses the ceiling
+    buf = bytearray()
+    async for chunk in request.stream():
+        buf += chunk
+        if len(buf) > _MAX_RESULT_BODY:
+            raise HTTPException(status_code=413, detail="Result payload too large")
+    try:
+        result = orjson.loads(buf)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    _state.store_queue.put_nowait((workflow_id, result))
+    return {"status": "queued"}
+
+async def store_workflow_results_bulk_handler(request: Request):
+    """Store many workflow results in one request.
+
+    Amortizes HTTP round trips and JSON parsing for workflows that
+    emit several artifacts — the batched analogue of the per-id
+    store endpoint.
+    """
+    # Same streamed read and ceiling as the per-id endpoint: reject an
+    # oversized batch as soon as it crosses the limit, before parsing
+    buf = bytearray()
+    async for chunk in request.stream():
+        buf += chunk
+        if len(buf) > _MAX_RESULT_BODY:
+            raise HTTPException(status_code=413, detail="Result payload too large")
+    try:
+        body = orjson.loads(buf)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    results = body.get("results")
+    if not isinstance(results, dict):
+        raise HTTPException(status_code=400, detail="Expected a 'results' object")
+    if len(results) > 256:
+        raise HTTPException(status_code=413, detail="Too many results in one batch")
+    _state.workflow_results.update(results)
+    return {"status": "stored", "stored": len(results)}
+
+# Test metadata handler
+async def test_metadata_handler(request: Request):
+    """Real metadata extracted from Neo4j workflow (pre-serialized)."""
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=_TEST_METADATA_GZ,
+            media_type="application/json",
+            headers={
+                "ETag": _TEST_METADATA_ETAG,
+                "Content-Encoding": "gzip",
+                "Vary": "Accept-Encoding",
+            },
+        )
+    return Response(
+        content=_TEST_METADATA_BYTES,
+        media_type="application/json",
+        headers={"ETag": _TEST_METADATA_ETAG},
+    )
+
+
 APPLICATION_NAME = "neosense"
 
 @observability(logger=logger, metrics=metrics, traces=traces)
@@ -35,429 +471,157 @@ async def main():
     await app.setup_server(workflow_class=Neo4jWorkflow)
     logger.info("Base server setup is complete.")
     
-    # Try to access the FastAPI app through different possible attributes
-    fastapi_app = None
-    possible_attrs = ['server_app', 'app', '_app', 'fastapi_app', 'server', '_server']
-    
-    for attr in possible_attrs:
-        if hasattr(app, attr):
-            potential_app = getattr(app, attr)
-            logger.info(f"Checking attribute {attr}: {type(potential_app)}")
-            if potential_app and hasattr(potential_app, 'add_api_route'):
-                fastapi_app = potential_app
-                logger.info(f"Found FastAPI app via {attr}")
-                break
-            elif potential_app and hasattr(potential_app, 'get'):
-                # Might be a FastAPI app
-                fastapi_app = potential_app
-                logger.info(f"Found potential FastAPI app via {attr}")
-                break
-    
-    if fastapi_app:
-        logger.info(f"Found FastAPI app: {type(fastapi_app)}")
-        logger.info(f"FastAPI app methods: {[method for method in dir(fastapi_app) if 'route' in method.lower()]}")
+    # BaseApplication exposes its FastAPI instance at server.app (older
+    # builds hang it directly on .app); one direct lookup replaces the
+    # former six-name reflective probe
+    fastapi_app = getattr(getattr(app, "server", None), "app", None) or getattr(app, "app", None)
+
+    if fastapi_app is not None:
+        logger.debug("Resolved FastAPI app: %s", type(fastapi_app))
         setup_frontend_routes(fastapi_app)
     else:
         logger.warning("Could not find FastAPI app instance - routes will not be available")
-        # Print all available attributes for debugging
-        logger.info(f"Available attributes: {[attr for attr in dir(app) if not attr.startswith('_')]}")
-        
-        # Try a more direct approach
-        try:
-            # Check if we can access the server directly
-            if hasattr(app, 'server') and app.server:
-                logger.info(f"Found server: {type(app.server)}")
-                if hasattr(app.server, 'app'):
-                    fastapi_app = app.server.app
-                    logger.info(f"Found FastAPI app via server.app: {type(fastapi_app)}")
-                    setup_frontend_routes(fastapi_app)
-        except Exception as e:
-            logger.error(f"Error in direct server access: {e}")
-    
+
     await app.start_server()
 
 def setup_frontend_routes(fastapi_app):
     """Setup frontend routes"""
     logger.info("=== SETTING UP FRONTEND ROUTES ===")
-    logger.info(f"FastAPI app type: {type(fastapi_app)}")
-    
-    # Simple in-memory storage for workflow results
-    workflow_results = {}
-    
-    from fastapi import HTTPException
-    import json
-    import os
-    
-    # Test connection function
-    async def test_connection_handler(request: Request):
-        """Test Neo4j connection with provided credentials"""
-        try:
-            from app.client import Neo4jClient
-            
-            # Get JSON body from request
-            body = await request.json()
-            
-            # Extract credentials
-            uri = body.get("neo4j_uri")
-            username = body.get("neo4j_username")
-            password = body.get("neo4j_password")
-            
-            logger.info(f"Testing connection to {uri} with username {username}")
-            
-            if not all([uri, username, password]):
-                return {"success": False, "error": "Missing required credentials"}
-            
-            # Test connection
-            client = Neo4jClient(uri=uri, username=username, password=password)
-            await client.load()
-            
-            # Run a simple test query
-            result = await client.run_query("RETURN 1 as test")
-            
-            await client.close()
-            
-            logger.info("Connection test successful")
-            return {"success": True, "message": "Connection successful"}
-            
-        except Exception as e:
-            logger.error(f"Connection test failed: {e}")
-            return {"success": False, "error": str(e)}
-    
-    # Register the route using add_api_route
-    try:
-        fastapi_app.add_api_route(
-            "/api/test-connection",
-            test_connection_handler,
-            methods=["POST"],
-            response_model=None
-        )
-        logger.info("Successfully registered /api/test-connection endpoint")
-    except Exception as e:
-        logger.error(f"Failed to register test-connection endpoint: {e}")
-        # Fallback: try direct route registration
-        try:
-            from fastapi import APIRouter
-            router = APIRouter()
-            
-            @router.post("/api/test-connection")
-            async def test_connection_route(request: Request):
-                return await test_connection_handler(request)
-            
-            fastapi_app.include_router(router)
-            logger.info("Successfully registered /api/test-connection via router")
-        except Exception as e2:
-            logger.error(f"Fallback route registration also failed: {e2}")
-
-    # Workflow result handlers
-    async def get_workflow_result_handler(workflow_id: str):
-        """Get workflow result from file storage or memory"""
-        logger.info(f"Checking for workflow result: {workflow_id}")
-        
-        # First check in-memory storage
-        if workflow_id in workflow_results:
-            logger.info("Found workflow result in memory!")
-            return workflow_results[workflow_id]
-        
-        # Then check file storage
-        results_dir = "workflow_results"
-        result_file = os.path.join(results_dir, f"{workflow_id}.json")
-        
-        if os.path.exists(result_file):
-            try:
-                with open(result_file, 'r') as f:
-                    result = json.load(f)
-                logger.info("Found workflow result in file storage!")
-                return result
-            except Exception as e:
-                logger.error(f"Error reading result file: {e}")
-        
-        # Finally check for latest result
-        latest_file = os.path.join(results_dir, "latest.json")
-        if os.path.exists(latest_file):
-            try:
-                with open(latest_file, 'r') as f:
-                    result = json.load(f)
-                logger.info("Found latest workflow result!")
-                return result
-            except Exception as e:
-                logger.error(f"Error reading latest result file: {e}")
-        
-        logger.info("Workflow result not ready yet")
-        raise HTTPException(status_code=404, detail="Workflow not ready")
-    
-    async def get_latest_workflow_result_handler():
-        """Get the latest workflow result"""
-        logger.info("Fetching latest workflow result")
-        
-        # Check for latest result file
-        results_dir = "workflow_results"
-        latest_file = os.path.join(results_dir, "latest.json")
-        
-        if os.path.exists(latest_file):
-            try:
-                with open(latest_file, 'r') as f:
-                    result = json.load(f)
-                logger.info("Found latest workflow result!")
-                return result
-            except Exception as e:
-                logger.error(f"Error reading latest result file: {e}")
-        
-        logger.info("No latest workflow result available")
-        raise HTTPException(status_code=404, detail="No workflow results available")
-    
-    async def store_workflow_result_handler(workflow_id: str, request: Request):
-        """Store workflow result (this will be called by our workflow)"""
-        logger.info(f"Storing result for workflow: {workflow_id}")
-        result = await request.json()
-        workflow_results[workflow_id] = result
-        return {"status": "stored"}
-    
-    # Register workflow result endpoints
-    try:
-        fastapi_app.add_api_route(
-            "/api/workflow-result/{workflow_id}",
-            get_workflow_result_handler,
-            methods=["GET"]
-        )
-        fastapi_app.add_api_route(
-            "/api/store-result/{workflow_id}",
-            store_workflow_result_handler,
-            methods=["POST"]
-        )
-        fastapi_app.add_api_route(
-            "/api/workflow-result/latest",
-            get_latest_workflow_result_handler,
-            methods=["GET"]
-        )
-        logger.info("Successfully registered workflow result endpoints")
-    except Exception as e:
-        logger.error(f"Failed to register workflow result endpoints: {e}")
-    
-    # Test metadata handler
-    async def test_metadata_handler():
-        """Real metadata extracted from Neo4j workflow"""
-        return {
-            "Business Context": {
-                "customer_segments": [
-                    {"customer_count": 2, "is_premium": True},
-                    {"customer_count": 2, "is_premium": False}
-                ],
-                "graph_statistics": {
-                    "node_counts_by_label": [
-                        {"count": 5, "label": "Product"},
-                        {"count": 4, "label": "Customer"},
-                        {"count": 4, "label": "Order"},
-                        {"count": 3, "label": "Category"},
-                        {"count": 2, "label": "Supplier"}
-                    ],
-                    "relationship_counts_by_type": [
-                        {"count": 5, "type": "BELONGS_TO"},
-                        {"count": 5, "type": "CONTAINS"},
-                        {"count": 4, "type": "PLACED_ORDER"},
-                        {"count": 3, "type": "SUPPLIES"}
-                    ],
-                    "total_nodes": [{"count": 18}],
-                    "total_relationships": [{"count": 17}]
-                },
-                "order_statistics": [
-                    {"order_count": 1, "order_status": "Shipped"},
-                    {"order_count": 1, "order_status": "Processing"},
-                    {"order_count": 1, "order_status": "Delivered"},
-                    {"order_count": 1, "order_status": "Cancelled"}
-                ],
-                "product_catalog": {
-                    "descriptions": [
-                        {"category": "Office Supplies", "price": 12.99, "product_description": "Ceramic coffee mug with company logo.", "product_name": "Coffee Mug"},
-                        {"category": "Electronics", "price": 1299.99, "product_description": "High-performance laptop for professionals and creatives.", "product_name": "MacBook Pro"},
-                        {"category": "Electronics", "price": 79.99, "product_description": "Multi-port USB-C hub with HDMI and ethernet.", "product_name": "USB-C Hub"},
-                        {"category": "Electronics", "price": 29.99, "product_description": "Ergonomic wireless mouse with precision tracking.", "product_name": "Wireless Mouse"}
-                    ],
-                    "total_products": 4
-                }
-            },
-            "Lineage Information": {
-                "data_flow": {
-                    "connections": ["BELONGS_TO", "CONTAINS", "PLACED_ORDER", "SUPPLIES"],
-                    "entities": ["Category", "Customer", "Order", "Product", "Supplier"],
-                    "potential_flows": [
-                        "Category -> BELONGS_TO -> Customer",
-                        "Category -> CONTAINS -> Customer",
-                        "Category -> PLACED_ORDER -> Customer",
-                        "Category -> SUPPLIES -> Customer",
-                        "Category -> BELONGS_TO -> Order",
-                        "Category -> CONTAINS -> Order",
-                        "Category -> PLACED_ORDER -> Order",
-                        "Category -> SUPPLIES -> Order",
-                        "Category -> BELONGS_TO -> Product",
-                        "Category -> CONTAINS -> Product"
-                    ]
-                },
-                "graph_dependencies": [
-                    "(:Customer)-[:PLACED_ORDER]->(:Order)",
-                    "(:Order)-[:CONTAINS]->(:Product)",
-                    "(:Product)-[:BELONGS_TO]->(:Category)",
-                    "(:Supplier)-[:SUPPLIES]->(:Product)"
-                ],
-                "relationship_patterns": {
-                    "patterns": [
-                        "(:Customer)-[:PLACED_ORDER]->(:Order)",
-                        "(:Order)-[:CONTAINS]->(:Product)",
-                        "(:Product)-[:BELONGS_TO]->(:Category)",
-                        "(:Supplier)-[:SUPPLIES]->(:Product)"
-                    ],
-                    "patterns_by_relationship_type": {
-                        "BELONGS_TO": ["(:Product)-[:BELONGS_TO]->(:Category)"],
-                        "CONTAINS": ["(:Order)-[:CONTAINS]->(:Product)"],
-                        "PLACED_ORDER": ["(:Customer)-[:PLACED_ORDER]->(:Order)"],
-                        "SUPPLIES": ["(:Supplier)-[:SUPPLIES]->(:Product)"]
-                    },
-                    "total_patterns": 4,
-                    "unique_relationship_types": 4
-                }
-            },
-            "Quality Metrics": {
-                "Customer.email": {
-                    "metric_type": "Null Count",
-                    "null_count": 1,
-                    "total_records": 4,
-                    "unique_values": 3
-                },
-                "Order.status": {
-                    "metric_type": "Completeness",
-                    "null_count": 0,
-                    "total_records": 4,
-                    "unique_values": 4
-                },
-                "Product.category": {
-                    "metric_type": "Uniqueness",
-                    "null_count": 0,
-                    "total_records": 5,
-                    "unique_values": 3
-                },
-                "data_completeness": {
-                    "field_level_completeness": {
-                        "Customer.email": {
-                            "completeness_percentage": 75,
-                            "null_count": 1,
-                            "total_count": 4
-                        },
-                        "Order.status": {
-                            "completeness_percentage": 100,
-                            "null_count": 0,
-                            "total_count": 4
-                        },
-                        "Product.category": {
-                            "completeness_percentage": 100,
-                            "null_count": 0,
-                            "total_count": 5
-                        }
-                    },
-                    "overall_completeness_percentage": 92.31,
-                    "total_fields_analyzed": 3
-                },
-                "data_uniqueness": {
-                    "Customer.email": {
-                        "duplicate_records": 1,
-                        "total_records": 4,
-                        "unique_values": 3,
-                        "uniqueness_percentage": 75
-                    },
-                    "Order.status": {
-                        "duplicate_records": 0,
-                        "total_records": 4,
-                        "unique_values": 4,
-                        "uniqueness_percentage": 100
-                    },
-                    "Product.category": {
-                        "duplicate_records": 2,
-                        "total_records": 5,
-                        "unique_values": 3,
-                        "uniqueness_percentage": 60
-                    }
-                }
-            },
-            "Schema Information": {
-                "constraints": [
-                    {"labelsOrTypes": ["Customer"], "name": "customer_email_unique", "properties": ["email"], "type": "UNIQUENESS"},
-                    {"labelsOrTypes": ["Order"], "name": "order_id_unique", "properties": ["orderId"], "type": "UNIQUENESS"},
-                    {"labelsOrTypes": ["Product"], "name": "product_id_unique", "properties": ["productId"], "type": "UNIQUENESS"}
-                ],
-                "indexes": [
-                    {"labelsOrTypes": ["Customer"], "name": "customer_email_unique", "properties": ["email"], "type": "RANGE"},
-                    {"labelsOrTypes": ["Customer"], "name": "customer_name_index", "properties": ["name"], "type": "RANGE"},
-                    {"labelsOrTypes": None, "name": "index_343aff4e", "properties": None, "type": "LOOKUP"},
-                    {"labelsOrTypes": None, "name": "index_f7700477", "properties": None, "type": "LOOKUP"},
-                    {"labelsOrTypes": ["Order"], "name": "order_id_unique", "properties": ["orderId"], "type": "RANGE"},
-                    {"labelsOrTypes": ["Order"], "name": "order_status_index", "properties": ["status"], "type": "RANGE"},
-                    {"labelsOrTypes": ["Product"], "name": "product_category_index", "properties": ["category"], "type": "RANGE"},
-                    {"labelsOrTypes": ["Product"], "name": "product_id_unique", "properties": ["productId"], "type": "RANGE"}
-                ],
-                "node_labels": ["Category", "Customer", "Order", "Product", "Supplier"],
-                "node_property_details": {
-                    "Category": {"description": "STRING", "name": "STRING"},
-                    "Customer": {"age": "INTEGER", "city": "STRING", "customerId": "STRING", "email": "STRING", "isPremium": "BOOLEAN", "name": "STRING", "signupDate": "STRING"},
-                    "Order": {"orderDate": "STRING", "orderId": "STRING", "shippingAddress": "STRING", "status": "STRING", "totalAmount": "FLOAT"},
-                    "Product": {"brand": "STRING", "category": "STRING", "description": "STRING", "name": "STRING", "price": "FLOAT", "productId": "STRING", "rating": "FLOAT", "stock": "INTEGER"},
-                    "Supplier": {"country": "STRING", "name": "STRING", "supplierId": "STRING"}
-                },
-                "relationship_types": ["BELONGS_TO", "CONTAINS", "PLACED_ORDER", "SUPPLIES"]
-            }
-        }
-    
-    # Register test metadata endpoint
-    try:
-        fastapi_app.add_api_route(
-            "/test/metadata",
-            test_metadata_handler,
-            methods=["GET"]
-        )
-        logger.info("Successfully registered test metadata endpoint")
-    except Exception as e:
-        logger.error(f"Failed to register test metadata endpoint: {e}")
-    
+    logger.info("FastAPI app type: %s", type(fastapi_app))
+
+    # JSON bodies compress 5-10x; anything over 1KB is worth the CPU.
+    # Responses that arrive pre-compressed (Content-Encoding already
+    # set, like /test/metadata) are passed through untouched
+    from fastapi.middleware.gzip import GZipMiddleware
+    fastapi_app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+    # One router included once: routes compile in a single pass instead
+    # of incremental add_api_route mutations, and the JSON endpoints
+    # inherit ORJSONResponse from the router default
+    router = APIRouter(default_response_class=ORJSONResponse)
+    router.add_api_route(
+        "/api/test-connection",
+        test_connection_handler,
+        methods=["POST"],
+        response_model=None
+    )
+    router.add_api_route(
+        "/api/workflow-result/{workflow_id}",
+        get_workflow_result_handler,
+        methods=["GET"],
+        response_model=None
+    )
+    router.add_api_route(
+        "/api/store-result/{workflow_id}",
+        store_workflow_result_handler,
+        methods=["POST"],
+        response_model=None
+    )
+    router.add_api_route(
+        "/api/store-results",
+        store_workflow_results_bulk_handler,
+        methods=["POST"],
+        response_model=None
+    )
+    router.add_api_route(
+        "/api/workflow-result/latest",
+        get_latest_workflow_result_handler,
+        methods=["GET"],
+        response_model=None
+    )
+    router.add_api_route(
+        "/test/metadata",
+        test_metadata_handler,
+        methods=["GET"],
+        response_model=None
+    )
+
     # Frontend routes
     frontend_dir = Path("frontend")
-    if not frontend_dir.exists():
-        logger.warning("Frontend directory not found.")
-        return
-    
-    # Mount static files
-    static_dir = frontend_dir / "static"
-    if static_dir.exists():
-        fastapi_app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
-    
-    # Setup templates
-    templates_dir = frontend_dir / "templates"
-    if templates_dir.exists():
-        templates = Jinja2Templates(directory=str(templates_dir))
-        
-        async def home_handler(request: Request):
-            return templates.TemplateResponse("index.html", {"request": request})
-        
-        async def favicon_handler():
-            return {"message": "No favicon"}
-        
-        # Register frontend routes
-        try:
-            fastapi_app.add_api_route(
+    if frontend_dir.exists():
+        # Mount static files
+        static_dir = frontend_dir / "static"
+        if static_dir.exists():
+            fastapi_app.mount("/static", _CachedStaticFiles(directory=str(static_dir)), name="static")
+
+        # Setup templates
+        templates_dir = frontend_dir / "templates"
+        if templates_dir.exists():
+            templates = Jinja2Templates(directory=str(templates_dir))
+            # Templates don't change at runtime: skip the per-render
+            # mtime check and persist compiled bytecode across restarts
+            templates.env.auto_reload = False
+            try:
+                from jinja2 import FileSystemBytecodeCache
+
+                cache_dir = Path(".jinja_cache")
+                cache_dir.mkdir(exist_ok=True)
+                templates.env.bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+            except OSError as e:
+                logger.debug("Jinja bytecode cache disabled: %s", e)
+
+            # index.html only depends on the request through url_for's
+            # base URL, so render it once per base URL and serve the
+            # cached bytes — the template engine drops out of the hot path
+            home_cache: dict[str, tuple[bytes, str]] = {}
+
+            async def home_handler(request: Request):
+                base = str(request.base_url)
+                hit = home_cache.get(base)
+                if hit is None:
+                    html = templates.get_template("index.html").render(
+                        {"request": request}
+                    )
+                    body = html.encode()
+                    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+                    hit = (body, etag)
+                    if len(home_cache) < 8:
+                        home_cache[base] = hit
+                return HTMLResponse(
+                    content=hit[0],
+                    headers={"ETag": hit[1], "Cache-Control": "public, max-age=60"},
+                )
+
+            async def favicon_handler():
+                # No favicon shipped; a cached 204 beats serializing a
+                # JSON body for every browser probe
+                return Response(
+                    status_code=204,
+                    headers={"Cache-Control": "public, max-age=86400"},
+                )
+
+            router.add_api_route(
                 "/",
                 home_handler,
                 methods=["GET"],
                 response_class=HTMLResponse
             )
-            fastapi_app.add_api_route(
+            router.add_api_route(
                 "/favicon.ico",
                 favicon_handler,
                 methods=["GET"]
             )
-            logger.info("Successfully registered frontend routes")
-        except Exception as e:
-            logger.error(f"Failed to register frontend routes: {e}")
-    
+    else:
+        logger.warning("Frontend directory not found.")
+
+    fastapi_app.include_router(router)
+    fastapi_app.add_event_handler("startup", _start_store_drain)
+    fastapi_app.add_event_handler("shutdown", _close_cached_clients)
+    fastapi_app.add_event_handler("shutdown", results_store.close)
+
     # Make the storage accessible to the workflow
-    fastapi_app.workflow_results = workflow_results
-    
+    fastapi_app.workflow_results = _state.workflow_results
+
     logger.info("Frontend routes setup completed successfully")
 
 if __name__ == "__main__":
+    # uvloop ships with uvicorn[standard] on supported platforms; its
+    # C-accelerated event loop handles the whole process since the
+    # server runs inside the loop asyncio.run creates here
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file